@@ -11,6 +11,7 @@ import os
 warnings.filterwarnings("ignore")
 
 PTN = re.compile("([h]?an[n]?a)(.*?)(thank(?:s| you))")
+PUNCT_TABLE = str.maketrans(".,;:!?", "      ")
 
 aai.settings.api_key = os.getenv("ASSEMBLYAI_API_KEY")
 DON_API_URL = os.getenv("DON_API_URL")
@@ -30,7 +31,7 @@ class msg(str, Enum):
 def get_cmd(transcript: str) -> str:
     global PTN
 
-    cmd = re.sub("[.,;:!?]", " ", transcript).strip()
+    cmd = transcript.translate(PUNCT_TABLE).strip()
     match = PTN.search(cmd)
     # match = PTN.search(transcript)
 